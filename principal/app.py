@@ -1,6 +1,7 @@
 import os
 import sys
 import uuid
+import hashlib
 import numpy as np
 import logging
 import traceback
@@ -48,9 +49,14 @@ class SessionManager:
             "media": float(np.mean(datos)),
             "std": float(np.std(datos, ddof=1))
         }
+        # Huella de los datos: base de los ETag de la sesion
+        huella = hashlib.sha256(
+            np.ascontiguousarray(datos, dtype=np.float64).tobytes()
+        ).hexdigest()
         self.sessions[session_id] = {
             "datos": datos,
             "stats": stats,
+            "huella": huella,
             "fuente": fuente,
             "timestamp": datetime.now()
         }
@@ -67,6 +73,12 @@ class SessionManager:
         key = f"{session_id}_{umbral}_{confianza}"
         self.cache_resultados[key] = resultado
 
+    def generar_etag(self, session_id, umbral, confianza):
+        # ETag fuerte: mismos datos y mismos parametros -> misma respuesta
+        sesion = self.sessions[session_id]
+        base = f"{sesion['huella']}_{umbral}_{confianza}"
+        return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
 session_manager = SessionManager()
 
 def serializar_numpy(obj):
@@ -77,6 +89,21 @@ def serializar_numpy(obj):
     if isinstance(obj, (list, tuple)): return [serializar_numpy(v) for v in obj]
     return obj
 
+def tiene_errores(resultado):
+    return any(isinstance(cap, dict) and "error" in cap for cap in resultado.values())
+
+def respuesta_cacheable(cuerpo, etag, cacheable=True, status=200):
+    # ETag solo para resultados completos; Cache-Control solo en GET/HEAD.
+    # no-cache: el proxy guarda la respuesta pero revalida siempre con el ETag,
+    # asi no sirve sesiones que ya no existen en memoria
+    response = app.response_class(cuerpo, status=status, mimetype="application/json")
+    if cacheable:
+        response.set_etag(etag)
+        if request.method in ("GET", "HEAD"):
+            response.cache_control.public = True
+            response.cache_control.no_cache = True
+    return response
+
 @app.route("/")
 def index():
     return render_template("index.html")
@@ -155,10 +182,11 @@ def generar_ejemplo():
         print(f"Error en generar_ejemplo: {e}")
         return jsonify({"success": False, "error": str(e)}), 400
 
-@app.route("/api/analisis_completo", methods=["POST"])
+@app.route("/api/analisis_completo", methods=["GET", "POST"])
 def analisis_completo():
     try:
-        params = request.get_json()
+        # GET permite que un proxy inverso sirva las peticiones repetidas
+        params = request.args if request.method in ("GET", "HEAD") else request.get_json()
         session_id = params.get("session_id")
         umbral = float(params.get("umbral", 5.0))
         nivel_confianza = float(params.get("nivel_confianza", 0.95))
@@ -170,10 +198,18 @@ def analisis_completo():
         
         datos = sesion["datos"]
         
-        # Verificar cache
+        # Peticion condicional: el cliente ya tiene esta respuesta
+        etag = session_manager.generar_etag(session_id, umbral, nivel_confianza)
+        if request.if_none_match.contains_weak(etag):
+            if request.method in ("GET", "HEAD"):
+                return respuesta_cacheable(b"", etag, status=304)
+            return jsonify({"error": "El recurso no ha cambiado (If-None-Match)"}), 412
+        
+        # Verificar cache (se guarda el JSON ya serializado)
         cached = session_manager.obtener_cache(session_id, umbral, nivel_confianza)
         if cached:
-            return jsonify(cached)
+            cuerpo, cacheable = cached
+            return respuesta_cacheable(cuerpo, etag, cacheable)
         
         # Ejecutar análisis
         resultado = {}
@@ -219,9 +255,11 @@ def analisis_completo():
             resultado["capitulo5_comparacion"] = {"error": str(e)}
         
         # Guardar en cache
-        session_manager.guardar_cache(session_id, umbral, nivel_confianza, resultado)
+        cuerpo = app.json.dumps(resultado)
+        cacheable = not tiene_errores(resultado)
+        session_manager.guardar_cache(session_id, umbral, nivel_confianza, (cuerpo, cacheable))
         
-        return jsonify(resultado)
+        return respuesta_cacheable(cuerpo, etag, cacheable)
         
     except Exception as e:
         logger.error(f"Error crítico en analisis_completo: {traceback.format_exc()}")
@@ -148,10 +148,9 @@ const app = {
         </div>`;
 
         try {
-            const r = await fetch('/api/analisis_completo', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(params)
+            // GET: el navegador revalida con If-None-Match y reutiliza la respuesta (304)
+            const r = await fetch(`/api/analisis_completo?${new URLSearchParams(params)}`, {
+                cache: 'no-cache'
             });
 
             const data = await r.json();